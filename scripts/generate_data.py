@@ -3,22 +3,23 @@
 from __future__ import annotations
 
 import csv
-import random
-from dataclasses import dataclass
-from datetime import date, timedelta
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import Iterable, Sequence, TypedDict
 
-from faker import Faker
+import numpy as np
 
-faker = Faker("en_IN")
-Faker.seed(2024)
-random.seed(2024)
+rng = np.random.default_rng(2024)
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 MIN_ROWS = 500
 MAX_ROWS = 1500
+NAME_POOL_SIZE = 200
+WRITE_BATCH_ROWS = 4096
+ORDER_WINDOW_DAYS = 365
+ORDER_WINDOW_START = np.datetime64(date.today(), "D") - np.timedelta64(ORDER_WINDOW_DAYS, "D")
 
 PRODUCT_CATEGORIES = [
     "Electronics",
@@ -34,45 +35,40 @@ ORDER_STATUSES = ["Pending", "Processing", "Shipped", "Delivered", "Cancelled"]
 PAYMENT_MODES = ["UPI", "Credit Card", "Debit Card", "Net Banking", "Wallet", "COD"]
 
 
-@dataclass
-class Product:
-    product_id: str
-    name: str
-    category: str
-    price: Decimal
+class CustomerTable(TypedDict):
+    customer_id: list[str]
+    name: list[str]
+    email: list[str]
+    country: list[str]
 
 
-@dataclass
-class Customer:
-    customer_id: str
-    name: str
-    email: str
-    country: str
+class ProductTable(TypedDict):
+    product_id: list[str]
+    name: list[str]
+    category: list[str]
+    price_paise: np.ndarray
 
 
-@dataclass
-class Order:
-    order_id: str
-    customer_id: str
-    order_date: date
-    status: str
+class OrderTable(TypedDict):
+    order_id: list[str]
+    customer_id: list[str]
+    order_day: np.ndarray
+    status: list[str]
 
 
-@dataclass
-class OrderItem:
-    item_id: str
-    order_id: str
-    product_id: str
-    quantity: int
+class OrderItemTable(TypedDict):
+    item_id: list[str]
+    order_id: list[str]
+    product_id: list[str]
+    quantity: np.ndarray
 
 
-@dataclass
-class Payment:
-    payment_id: str
-    order_id: str
-    amount: Decimal
-    mode: str
-    payment_date: date
+class PaymentTable(TypedDict):
+    payment_id: list[str]
+    order_id: list[str]
+    amount_paise: np.ndarray
+    mode: list[str]
+    payment_day: np.ndarray
 
 
 def ensure_data_dir() -> None:
@@ -80,21 +76,33 @@ def ensure_data_dir() -> None:
 
 
 def random_row_count() -> int:
-    return random.randint(MIN_ROWS, MAX_ROWS)
+    return int(rng.integers(MIN_ROWS, MAX_ROWS, endpoint=True))
 
 
-def generate_customers(count: int) -> List[Customer]:
-    customers: List[Customer] = []
-    faker.unique.clear()
-    for idx in range(1, count + 1):
-        customer_id = f"CUST{idx:05d}"
-        name = faker.name()
-        email = faker.unique.email()
-        customers.append(Customer(customer_id, name, email, "India"))
-    return customers
+def make_ids(prefix: str, count: int, width: int) -> list[str]:
+    """Build ``prefix`` + zero-padded 1-based sequence IDs, e.g. ``ORD000001``."""
+    if count == 0:
+        return []
+    return np.char.add(prefix, np.char.zfill(np.arange(1, count + 1).astype(str), width)).tolist()
 
 
-def generate_products(count: int) -> List[Product]:
+def generate_customers(count: int) -> CustomerTable:
+    # Faker is slow to import, so only pay for it when names are actually generated.
+    from faker import Faker
+
+    faker = Faker("en_IN")
+    Faker.seed(2024)
+    name_pool = [faker.name() for _ in range(NAME_POOL_SIZE)]
+    name_idx = rng.integers(0, len(name_pool), count).tolist()
+    return {
+        "customer_id": make_ids("CUST", count, 5),
+        "name": [name_pool[n] for n in name_idx],
+        "email": [f"c{idx:05d}@example.in" for idx in range(1, count + 1)],
+        "country": ["India"] * count,
+    }
+
+
+def generate_products(count: int) -> ProductTable:
     adjectives = ["Premium", "Classic", "Eco", "Smart", "Urban", "Elite", "Daily"]
     nouns = [
         "Phone",
@@ -108,87 +116,128 @@ def generate_products(count: int) -> List[Product]:
         "Saree",
         "Kurta",
     ]
-    products: List[Product] = []
-    for idx in range(1, count + 1):
-        product_id = f"PROD{idx:05d}"
-        name = f"{random.choice(adjectives)} {random.choice(nouns)}"
-        category = random.choice(PRODUCT_CATEGORIES)
-        price_paise = random.randint(19_900, 199_9900)
-        price = (Decimal(price_paise) / Decimal("100")).quantize(Decimal("0.01"))
-        products.append(Product(product_id, name, category, price))
-    return products
-
-
-def generate_orders(count: int, customers: List[Customer]) -> List[Order]:
-    orders: List[Order] = []
-    for idx in range(1, count + 1):
-        order_id = f"ORD{idx:06d}"
-        customer = random.choice(customers)
-        order_date = faker.date_between(start_date="-365d", end_date="today")
-        status = random.choice(ORDER_STATUSES)
-        orders.append(Order(order_id, customer.customer_id, order_date, status))
-    return orders
-
-
-def distribute_order_items(
-    target_count: int,
-    orders: List[Order],
-    products: List[Product],
-) -> tuple[List[OrderItem], dict[str, Decimal]]:
-    order_items: List[OrderItem] = []
-    order_totals: dict[str, Decimal] = {order.order_id: Decimal("0.00") for order in orders}
-    product_price_map = {product.product_id: product.price for product in products}
-
-    if target_count < len(orders):
-        target_count = len(orders)
-
-    for idx, order in enumerate(orders):
-        orders_remaining = len(orders) - (idx + 1)
-        items_left = target_count - len(order_items)
+    adj_idx = rng.integers(0, len(adjectives), count).tolist()
+    noun_idx = rng.integers(0, len(nouns), count).tolist()
+    cat_idx = rng.integers(0, len(PRODUCT_CATEGORIES), count).tolist()
+    price_paise = rng.integers(19_900, 1_999_900, count, dtype=np.int64, endpoint=True)
+    return {
+        "product_id": make_ids("PROD", count, 5),
+        "name": [f"{adjectives[a]} {nouns[n]}" for a, n in zip(adj_idx, noun_idx)],
+        "category": [PRODUCT_CATEGORIES[c] for c in cat_idx],
+        "price_paise": price_paise,
+    }
+
+
+def generate_orders(count: int, customers: CustomerTable) -> OrderTable:
+    customer_ids = customers["customer_id"]
+    customer_idx = rng.integers(0, len(customer_ids), count).tolist()
+    status_idx = rng.integers(0, len(ORDER_STATUSES), count).tolist()
+    return {
+        "order_id": make_ids("ORD", count, 6),
+        "customer_id": [customer_ids[c] for c in customer_idx],
+        "order_day": rng.integers(0, ORDER_WINDOW_DAYS, count, dtype=np.int64, endpoint=True),
+        "status": [ORDER_STATUSES[s] for s in status_idx],
+    }
+
+
+def draw_items_per_order(target_count: int, order_count: int) -> np.ndarray:
+    """Split ``target_count`` items across orders, giving every order at least one."""
+    items_per_order = np.empty(order_count, dtype=np.int64)
+    items_left = target_count
+    for idx, draw in enumerate(rng.random(order_count).tolist()):
+        orders_remaining = order_count - (idx + 1)
         max_for_order = items_left - orders_remaining
         if orders_remaining == 0:
             items_for_order = max_for_order
         else:
             soft_cap = 5
-            items_for_order = random.randint(1, max(1, min(soft_cap, max_for_order)))
+            items_for_order = 1 + int(draw * max(1, min(soft_cap, max_for_order)))
+        items_per_order[idx] = items_for_order
+        items_left -= items_for_order
+    return items_per_order
 
-        for _ in range(items_for_order):
-            item_id = f"ITEM{len(order_items) + 1:06d}"
-            product = random.choice(products)
-            quantity = random.randint(1, 5)
-            order_items.append(OrderItem(item_id, order.order_id, product.product_id, quantity))
-            line_total = product_price_map[product.product_id] * Decimal(quantity)
-            order_totals[order.order_id] += line_total
 
+def distribute_order_items(
+    target_count: int,
+    orders: OrderTable,
+    products: ProductTable,
+) -> tuple[OrderItemTable, np.ndarray]:
+    order_ids = orders["order_id"]
+    product_ids = products["product_id"]
+    if target_count < len(order_ids):
+        target_count = len(order_ids)
+
+    items_per_order = draw_items_per_order(target_count, len(order_ids))
+    item_order_idx = np.repeat(np.arange(len(order_ids)), items_per_order)
+    item_product_idx = rng.integers(0, len(product_ids), target_count)
+    item_quantity = rng.integers(1, 5, target_count, dtype=np.int64, endpoint=True)
+
+    line_totals = products["price_paise"][item_product_idx] * item_quantity
+    order_totals = np.zeros(len(order_ids), dtype=np.int64)
+    np.add.at(order_totals, item_order_idx, line_totals)
+
+    order_items: OrderItemTable = {
+        "item_id": make_ids("ITEM", target_count, 6),
+        "order_id": [order_ids[o] for o in item_order_idx.tolist()],
+        "product_id": [product_ids[p] for p in item_product_idx.tolist()],
+        "quantity": item_quantity,
+    }
     return order_items, order_totals
 
 
-def generate_payments(orders: List[Order], order_totals: dict[str, Decimal]) -> List[Payment]:
-    payments: List[Payment] = []
-    for idx, order in enumerate(orders, start=1):
-        amount = order_totals[order.order_id].quantize(Decimal("0.01"))
-        payment_date = order.order_date + timedelta(days=random.randint(0, 3))
-        mode = random.choice(PAYMENT_MODES)
-        payments.append(
-            Payment(
-                payment_id=f"PAY{idx:06d}",
-                order_id=order.order_id,
-                amount=amount,
-                mode=mode,
-                payment_date=payment_date,
-            )
-        )
-    return payments
-
-
-def write_csv(filename: str, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
+def generate_payments(orders: OrderTable, order_totals: np.ndarray) -> PaymentTable:
+    count = len(orders["order_id"])
+    payment_delay = rng.integers(0, 3, count, dtype=np.int64, endpoint=True)
+    mode_idx = rng.integers(0, len(PAYMENT_MODES), count).tolist()
+    return {
+        "payment_id": make_ids("PAY", count, 6),
+        "order_id": orders["order_id"],
+        "amount_paise": order_totals,
+        "mode": [PAYMENT_MODES[m] for m in mode_idx],
+        "payment_day": orders["order_day"] + payment_delay,
+    }
+
+
+def format_paise(paise: np.ndarray) -> list[str]:
+    """Render a column of paise amounts as rupee strings with two decimals."""
+    if paise.size == 0:
+        return []
+    rupees, remainder = np.divmod(paise, 100)
+    return np.char.add(
+        np.char.add(rupees.astype(str), "."),
+        np.char.zfill(remainder.astype(str), 2),
+    ).tolist()
+
+
+def format_days(days: np.ndarray) -> list[str]:
+    """Render day offsets from ORDER_WINDOW_START as ISO dates."""
+    dates = ORDER_WINDOW_START + days.astype("timedelta64[D]")
+    return dates.astype(str).tolist()
+
+
+def write_csv(filename: str, fieldnames: list[str], rows: Iterable[Sequence[object]]) -> None:
     file_path = DATA_DIR / filename
     with file_path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
         writer.writerows(rows)
 
 
+def write_order_items_csv(order_items: OrderItemTable) -> None:
+    """Write order_items.csv without csv.writer; its fields are ASCII IDs and ints, never quoted."""
+    file_path = DATA_DIR / "order_items.csv"
+    rows = zip(
+        order_items["item_id"],
+        order_items["order_id"],
+        order_items["product_id"],
+        order_items["quantity"].tolist(),
+    )
+    with file_path.open("wb", buffering=1 << 20) as fh:
+        fh.write(b"item_id,order_id,product_id,quantity\r\n")
+        while batch := list(islice(rows, WRITE_BATCH_ROWS)):
+            fh.write("".join(f"{i},{o},{p},{q}\r\n" for i, o, p, q in batch).encode("ascii"))
+
+
 def main() -> None:
     ensure_data_dir()
 
@@ -203,60 +252,49 @@ def main() -> None:
     order_items, order_totals = distribute_order_items(order_items_target, orders, products)
     payments = generate_payments(orders, order_totals)
 
-    write_csv(
-        "customers.csv",
-        ["customer_id", "name", "email", "country"],
-        [customer.__dict__ for customer in customers],
-    )
-
-    write_csv(
-        "products.csv",
-        ["product_id", "name", "category", "price"],
-        [
-            {
-                "product_id": product.product_id,
-                "name": product.name,
-                "category": product.category,
-                "price": format(product.price, ".2f"),
-            }
-            for product in products
-        ],
-    )
-
-    write_csv(
-        "orders.csv",
-        ["order_id", "customer_id", "order_date", "status"],
-        [
-            {
-                "order_id": order.order_id,
-                "customer_id": order.customer_id,
-                "order_date": order.order_date.isoformat(),
-                "status": order.status,
-            }
-            for order in orders
-        ],
-    )
-
-    write_csv(
-        "order_items.csv",
-        ["item_id", "order_id", "product_id", "quantity"],
-        [item.__dict__ for item in order_items],
-    )
-
-    write_csv(
-        "payments.csv",
-        ["payment_id", "order_id", "amount", "mode", "payment_date"],
-        [
-            {
-                "payment_id": payment.payment_id,
-                "order_id": payment.order_id,
-                "amount": format(payment.amount, ".2f"),
-                "mode": payment.mode,
-                "payment_date": payment.payment_date.isoformat(),
-            }
-            for payment in payments
-        ],
-    )
+    csv_jobs = [
+        (
+            "customers.csv",
+            ["customer_id", "name", "email", "country"],
+            zip(customers["customer_id"], customers["name"], customers["email"], customers["country"]),
+        ),
+        (
+            "products.csv",
+            ["product_id", "name", "category", "price"],
+            zip(
+                products["product_id"],
+                products["name"],
+                products["category"],
+                format_paise(products["price_paise"]),
+            ),
+        ),
+        (
+            "orders.csv",
+            ["order_id", "customer_id", "order_date", "status"],
+            zip(
+                orders["order_id"],
+                orders["customer_id"],
+                format_days(orders["order_day"]),
+                orders["status"],
+            ),
+        ),
+        (
+            "payments.csv",
+            ["payment_id", "order_id", "amount", "mode", "payment_date"],
+            zip(
+                payments["payment_id"],
+                payments["order_id"],
+                format_paise(payments["amount_paise"]),
+                payments["mode"],
+                format_days(payments["payment_day"]),
+            ),
+        ),
+    ]
+    with ThreadPoolExecutor(max_workers=len(csv_jobs) + 1) as executor:
+        futures = [executor.submit(write_csv, *job) for job in csv_jobs]
+        futures.append(executor.submit(write_order_items_csv, order_items))
+        for future in futures:
+            future.result()
 
     print("Synthetic datasets generated in", DATA_DIR)
 
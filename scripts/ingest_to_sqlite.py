@@ -2,17 +2,24 @@
 """Load generated CSV datasets into a SQLite database."""
 from __future__ import annotations
 
+import csv
+import os
 import sqlite3
+from itertools import chain, islice
 from pathlib import Path
 from typing import Dict, Tuple
 
-import pandas as pd
-
 ROOT_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT_DIR / "data"
 DB_DIR = ROOT_DIR / "db"
 DB_PATH = DB_DIR / "ecom.db"
 
+INSERT_BATCH_ROWS = 500
+# Opt-in: load through SQLite's csv virtual table instead of binding rows from Python.
+CSV_VTAB_ENV_VAR = "ECOM_INGEST_CSV_VTAB"
+
+# generate_data writes ISO dates and plain decimal/integer strings, so CSV values are
+# inserted as-is and the REAL/INTEGER column affinities below do the type conversion.
 CSV_TABLES: Dict[str, Tuple[str, str]] = {
     "customers.csv": (
         "customers",
@@ -94,56 +101,103 @@ def init_db() -> sqlite3.Connection:
     ensure_dirs()
     conn = sqlite3.connect(DB_PATH)
     conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
     drop_statements = [f"DROP TABLE IF EXISTS {table_name};" for _, (table_name, _) in CSV_TABLES.items()]
     schema_statements = [schema for _, (_, schema) in CSV_TABLES.items()]
     conn.executescript("\n".join(drop_statements + schema_statements))
     return conn
 
 
-def normalize_dataframe(table: str, df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    if table == "customers":
-        df["name"] = df["name"].astype(str)
-    elif table == "products":
-        df["price"] = df["price"].astype(float)
-    elif table == "orders":
-        df["order_date"] = pd.to_datetime(df["order_date"]).dt.strftime("%Y-%m-%d")
-    elif table == "order_items":
-        df["quantity"] = df["quantity"].astype(int)
-    elif table == "payments":
-        df["amount"] = df["amount"].astype(float)
-        df["payment_date"] = pd.to_datetime(df["payment_date"]).dt.strftime("%Y-%m-%d")
-    return df
-
-
-def ingest_table(conn: sqlite3.Connection, csv_filename: str) -> int:
+def load_csv_extension(conn: sqlite3.Connection) -> bool:
+    """Load SQLite's csv virtual-table extension, returning False if unavailable."""
+    try:
+        conn.enable_load_extension(True)
+    except AttributeError:
+        return False
+    try:
+        conn.load_extension("csv")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.enable_load_extension(False)
+    return True
+
+
+def insert_via_csv_vtab(conn: sqlite3.Connection, table_name: str, csv_path: Path) -> int:
+    csv_literal = str(csv_path).replace("'", "''")
+    conn.execute(f"CREATE VIRTUAL TABLE temp.csv_in USING csv(filename='{csv_literal}', header=YES);")
+    try:
+        cursor = conn.execute("SELECT * FROM temp.csv_in LIMIT 0;")
+        column_list = ", ".join(column[0] for column in cursor.description)
+        conn.execute(f"INSERT INTO {table_name} ({column_list}) SELECT {column_list} FROM temp.csv_in;")
+    finally:
+        conn.execute("DROP TABLE temp.csv_in;")
+    # generate_data never writes multi-line fields, so every line after the header is a row.
+    with csv_path.open("rb") as csvfile:
+        return sum(1 for _ in csvfile) - 1
+
+
+def max_sql_variables(conn: sqlite3.Connection) -> int:
+    """Return the connection's bound-parameter limit."""
+    if hasattr(conn, "getlimit"):
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    # Before Python 3.11 the limit cannot be queried; fall back to SQLite's
+    # compiled-in default, which rose from 999 to 32766 in 3.32.0.
+    return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+
+def insert_via_batched_values(conn: sqlite3.Connection, table_name: str, csv_path: Path) -> int:
+    with csv_path.open(newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile)
+        columns = next(reader)
+        batch_size = max(1, min(INSERT_BATCH_ROWS, max_sql_variables(conn) // len(columns)))
+        row_placeholder = f"({', '.join('?' for _ in columns)})"
+        insert_prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+        full_batch_sql = insert_prefix + ", ".join([row_placeholder] * batch_size) + ";"
+
+        row_count = 0
+        while batch := list(islice(reader, batch_size)):
+            if len(batch) == batch_size:
+                insert_sql = full_batch_sql
+            else:
+                insert_sql = insert_prefix + ", ".join([row_placeholder] * len(batch)) + ";"
+            conn.execute(insert_sql, list(chain.from_iterable(batch)))
+            row_count += len(batch)
+    return row_count
+
+
+def ingest_table(conn: sqlite3.Connection, csv_filename: str, use_csv_vtab: bool = False) -> int:
     table_name, _ = CSV_TABLES[csv_filename]
     csv_path = DATA_DIR / csv_filename
     if not csv_path.exists():
         raise FileNotFoundError(f"Missing required CSV file: {csv_path}")
 
-    df = pd.read_csv(csv_path)
-    df = normalize_dataframe(table_name, df)
-    expected_rows = len(df)
-    df.to_sql(table_name, conn, if_exists="append", index=False)
+    changes_before = conn.total_changes
+    if use_csv_vtab:
+        expected_rows = insert_via_csv_vtab(conn, table_name, csv_path)
+    else:
+        expected_rows = insert_via_batched_values(conn, table_name, csv_path)
+    inserted_rows = conn.total_changes - changes_before
 
-    result = conn.execute(f"SELECT COUNT(*) FROM {table_name};").fetchone()
-    if result is None:
-        raise RuntimeError(f"Unable to fetch row count for table {table_name}")
-    count_in_db = result[0]
-    if count_in_db != expected_rows:
+    if inserted_rows != expected_rows:
         raise ValueError(
-            f"Row count mismatch for {table_name}: expected {expected_rows}, got {count_in_db}"
+            f"Row count mismatch for {table_name}: expected {expected_rows}, got {inserted_rows}"
         )
-    print(f"Loaded {count_in_db} rows into '{table_name}' successfully.")
-    return count_in_db
+    print(f"Loaded {inserted_rows} rows into '{table_name}' successfully.")
+    return inserted_rows
 
 
 def main() -> None:
     with init_db() as conn:
+        use_csv_vtab = os.environ.get(CSV_VTAB_ENV_VAR) == "1" and load_csv_extension(conn)
         total_rows = 0
+        conn.execute("BEGIN;")
         for csv_filename in TABLE_ORDER:
-            total_rows += ingest_table(conn, csv_filename)
+            total_rows += ingest_table(conn, csv_filename, use_csv_vtab)
         conn.commit()
     print(f"All tables loaded into SQLite database at {DB_PATH} (total rows: {total_rows}).")
 
@@ -2,11 +2,10 @@
 """Execute the SQL report and present results."""
 from __future__ import annotations
 
+import csv
 import sqlite3
 from pathlib import Path
-
-import pandas as pd
-from tabulate import tabulate
+from typing import Any, List, Sequence, Tuple
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = ROOT_DIR / "db" / "ecom.db"
@@ -20,32 +19,45 @@ def load_sql() -> str:
     return REPORT_SQL_PATH.read_text(encoding="utf-8")
 
 
-def run_report(sql: str) -> pd.DataFrame:
+def run_report(sql: str) -> Tuple[List[str], List[Tuple[Any, ...]]]:
     if not DB_PATH.exists():
         raise FileNotFoundError("SQLite database not found. Run ingestion first.")
     with sqlite3.connect(DB_PATH) as conn:
-        return pd.read_sql_query(sql, conn)
+        cursor = conn.execute(sql)
+        columns = [column[0] for column in cursor.description]
+        return columns, cursor.fetchall()
+
+
+def format_cell(value: Any) -> str:
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
 
 
-def display_table(df: pd.DataFrame) -> None:
-    if df.empty:
+def display_table(columns: List[str], rows: Sequence[Tuple[Any, ...]]) -> None:
+    if not rows:
         print("No rows returned by the report.")
-    else:
-        print(tabulate(df, headers="keys", tablefmt="psql", showindex=False))
+        return
+    cells = [[format_cell(value) for value in row] for row in rows]
+    widths = [max(len(column), *(len(row[idx]) for row in cells)) for idx, column in enumerate(columns)]
+    print("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+    for row in cells:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
 
 
-def save_csv(df: pd.DataFrame) -> None:
+def save_csv(columns: List[str], rows: Sequence[Tuple[Any, ...]]) -> None:
     OUTPUT_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(OUTPUT_CSV_PATH, index=False)
+    with OUTPUT_CSV_PATH.open("w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
     print(f"Report saved to {OUTPUT_CSV_PATH}")
 
 
 def main() -> None:
     sql = load_sql()
-    df = run_report(sql)
-    display_table(df)
-    if not df.empty:
-        save_csv(df)
+    columns, rows = run_report(sql)
+    display_table(columns, rows)
+    if rows:
+        save_csv(columns, rows)
 
 
 if __name__ == "__main__":